@@ -1,55 +1,154 @@
 import os
+
+# Cooperative I/O is opt-in: USE_GEVENT covers direct `python casmonitor.py`
+# runs (the patch must land before the other imports); under gunicorn's
+# gevent worker the patching happens before this module even loads
+if os.environ.get('USE_GEVENT'):
+    from gevent import monkey
+    monkey.patch_all()
+
+import hashlib
 import psutil
 import shutil
 import time
-import json
 import threading
 import logging
+import queue
+import heapq
+from itertools import islice
+from functools import lru_cache, wraps
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
-from flask import Flask, render_template_string, jsonify, request
-from functools import wraps
-import humanize
-import requests
+from flask import Flask, Response, request, stream_with_context
+import numpy as np
+import orjson
 from collections import deque
+# WebSocket push is optional: with flask-socketio installed the server
+# broadcasts one consolidated frame per tick and clients skip polling,
+# otherwise everything falls back to the HTTP endpoints
+try:
+    from flask_socketio import SocketIO
+except ImportError:
+    SocketIO = None
+# Response compression is likewise optional; the list-heavy JSON
+# payloads shrink 5-10x under gzip when the package is present
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
 import signal
+import socket
 import sys
 import platform
-import subprocess
-import re
-import uuid
-from pathlib import Path
 
 app = Flask(__name__)
+socketio = SocketIO(app, async_mode='gevent' if os.environ.get('USE_GEVENT') else 'threading') if SocketIO else None
+if Compress:
+    app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html']
+    app.config['COMPRESS_LEVEL'] = 4
+    Compress(app)
 
 # Configuration
 REFRESH_INTERVAL = 3000  # milliseconds
-MAX_LOG_ENTRIES = 100
-SYSTEM_LOG = []
+MAX_LOG_ENTRIES = 1000
+SYSTEM_LOG = deque(maxlen=MAX_LOG_ENTRIES)
+# Monotonic entry counter plus a condition so SSE streams can sleep until
+# a new entry actually lands instead of polling the buffer
+_log_seq = 0
+_log_cond = threading.Condition()
 MONITORING_INTERVAL = 1000  # milliseconds
 CPU_HISTORY_SIZE = 60
 MEMORY_HISTORY_SIZE = 60
 NETWORK_HISTORY_SIZE = 60
-PROCESS_HISTORY_SIZE = 20
 TEMPERATURE_HISTORY_SIZE = 60
 DISK_HISTORY_SIZE = 60
+TEMP_TTL = 15  # seconds between sensor re-reads
+DISK_TTL = 15  # seconds between partition/usage re-reads
+
+class RingBuffer:
+    """Fixed-size ring buffer over a contiguous float32 array.
+
+    Samples live unboxed in the ndarray (nothing for the GC to scan) and
+    snapshot() is one C-level copy + bulk tolist() per request instead of
+    a Python-level walk of boxed floats.
+    """
+    def __init__(self, size):
+        self._buf = np.zeros(size, dtype=np.float32)
+        self._idx = 0
+        self._full = False
+
+    def push(self, value):
+        self._buf[self._idx] = value
+        self._idx = (self._idx + 1) % len(self._buf)
+        if self._idx == 0:
+            self._full = True
+
+    def snapshot(self):
+        """Return samples oldest-first as a plain list"""
+        if self._full:
+            return np.concatenate((self._buf[self._idx:], self._buf[:self._idx])).tolist()
+        return self._buf[:self._idx].tolist()
+
+    def stats(self):
+        """Min/max/avg/p95 over the recorded samples via numpy's C reductions"""
+        data = self._buf if self._full else self._buf[:self._idx]
+        if not len(data):
+            return {'min': 0.0, 'max': 0.0, 'avg': 0.0, 'p95': 0.0}
+        return {
+            'min': float(data.min()),
+            'max': float(data.max()),
+            'avg': float(data.mean()),
+            'p95': float(np.percentile(data, 95))
+        }
 
 # Data structures for historical tracking
-cpu_history = deque(maxlen=CPU_HISTORY_SIZE)
-memory_history = deque(maxlen=MEMORY_HISTORY_SIZE)
-network_history = deque(maxlen=NETWORK_HISTORY_SIZE)
-process_history = deque(maxlen=PROCESS_HISTORY_SIZE)
-temperature_history = deque(maxlen=TEMPERATURE_HISTORY_SIZE)
-disk_history = deque(maxlen=DISK_HISTORY_SIZE)
-
-# Configure logging
+cpu_history = RingBuffer(CPU_HISTORY_SIZE)
+memory_history = RingBuffer(MEMORY_HISTORY_SIZE)
+network_sent_history = RingBuffer(NETWORK_HISTORY_SIZE)
+network_recv_history = RingBuffer(NETWORK_HISTORY_SIZE)
+temperature_history = RingBuffer(TEMPERATURE_HISTORY_SIZE)
+disk_history = RingBuffer(DISK_HISTORY_SIZE)
+
+# Configure logging: request threads only enqueue records, a single
+# background listener thread drains them to the file/console so log
+# latency is decoupled from disk latency
+_log_queue = queue.SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('system_monitor.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_listener = QueueListener(
+    _log_queue,
+    logging.FileHandler('system_monitor.log'),
+    logging.StreamHandler()
+)
+_log_listener.start()
+
+# Prime psutil's CPU accounting so non-blocking cpu_percent(interval=None)
+# calls return meaningful deltas instead of 0.0 on first use
+psutil.cpu_percent(interval=None)
+psutil.cpu_percent(interval=None, percpu=True)
+
+# Core count never changes for the process lifetime
+_CPU_CORES = psutil.cpu_count()
+
+# Latest sampled snapshot, written by the background sampler thread and
+# read by the request handlers. The sampler builds a brand-new dict and
+# rebinds the name in one assignment; name rebinding is atomic under the
+# GIL and readers never mutate the dict, so no lock is needed on either
+# side (read-copy-update)
+CURRENT_SNAPSHOT = {}
+
+def _sampler():
+    """Sample system metrics at MONITORING_INTERVAL, independent of clients"""
+    global CURRENT_SNAPSHOT
+    while system_state['is_running']:
+        try:
+            CURRENT_SNAPSHOT = _compute_snapshot()
+        except Exception as e:
+            log_system_event('error', f'Sampler error: {str(e)}')
+        time.sleep(MONITORING_INTERVAL / 1000)
 
 # Global variables for system state
 system_state = {
@@ -60,50 +159,123 @@ system_state = {
     'last_temperature_check': 0,
     'temperature_data': [],
     'last_disk_check': 0,
-    'disk_data': []
+    'disk_data': [],
+    'mounts_mtime': 0.0
 }
 
+# On Linux the kernel bumps /proc/mounts' mtime when the mount table
+# changes, which lets the partition cache refresh on mount events
+# instead of waiting out its TTL
+_MOUNTS_PATH = '/proc/mounts' if os.path.exists('/proc/mounts') else None
+
+def _compute_disk_partitions():
+    """Scan mounts and usage, cached in system_state for DISK_TTL seconds
+    and additionally invalidated when the mount table changes"""
+    now = time.time()
+    mounts_mtime = system_state['mounts_mtime']
+    if _MOUNTS_PATH:
+        try:
+            mounts_mtime = os.stat(_MOUNTS_PATH).st_mtime
+        except OSError:
+            pass
+    if (now - system_state['last_disk_check'] <= DISK_TTL
+            and mounts_mtime == system_state['mounts_mtime']):
+        return system_state['disk_data']
+    disk_partitions = []
+    try:
+        partitions = psutil.disk_partitions()
+        for partition in partitions:
+            try:
+                usage = psutil.disk_usage(partition.mountpoint)
+                disk_partitions.append({
+                    'device': partition.device,
+                    'mountpoint': partition.mountpoint,
+                    'fstype': partition.fstype,
+                    'total': _human(usage.total),
+                    'used': _human(usage.used),
+                    'free': _human(usage.free),
+                    'percent': round((usage.used / usage.total) * 100, 2)
+                })
+            except PermissionError:
+                continue
+        system_state['disk_data'] = disk_partitions
+        system_state['last_disk_check'] = now
+        system_state['mounts_mtime'] = mounts_mtime
+    except Exception as e:
+        log_system_event('warning', f'Could not get disk partitions: {str(e)}')
+    return system_state['disk_data']
+
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+@lru_cache(maxsize=4096)
+def _human(n):
+    """Cheap humanize.naturalsize replacement for hot loops; sizes repeat
+    heavily across polls, so formatted strings are memoized"""
+    f = float(n)
+    i = 0
+    while f >= 1024 and i < len(_UNITS) - 1:
+        f /= 1024
+        i += 1
+    return f'{f:.1f} {_UNITS[i]}'
+
 def log_system_event(level, message):
     """Log system events with timestamp"""
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
     log_entry = {
         'timestamp': timestamp,
         'level': level,
         'message': message
     }
-    SYSTEM_LOG.append(log_entry)
-    if len(SYSTEM_LOG) > MAX_LOG_ENTRIES:
-        SYSTEM_LOG.pop(0)
+    global _log_seq
+    with _log_cond:
+        _log_seq += 1
+        log_entry['seq'] = _log_seq
+        SYSTEM_LOG.append(log_entry)
+        _log_cond.notify_all()
     # Also log to file
     log_level = logging.INFO if level == 'info' else logging.WARNING if level == 'warning' else logging.ERROR
     logging.log(log_level, message)
 
+# Short-lived cache so one dashboard tick hitting several endpoints only
+# walks /proc once instead of once per endpoint
+_proc_cache = {'t': 0.0, 'data': []}
+_proc_lock = threading.Lock()
+
+def _scan_processes(ttl=1.0):
+    """Walk all processes once and cache the result for a short TTL"""
+    with _proc_lock:
+        now = time.time()
+        if now - _proc_cache['t'] < ttl:
+            return _proc_cache['data']
+        processes = []
+        try:
+            # attrs= batches all reads inside psutil's own oneshot context
+            # and hands back a prebuilt dict, skipping one Python property
+            # call (and its syscalls) per attribute per process
+            for proc in psutil.process_iter(attrs=['pid', 'name', 'cpu_percent',
+                                                   'memory_percent', 'username']):
+                if proc.info['cpu_percent'] is not None:
+                    processes.append(proc.info)
+        except Exception as e:
+            log_system_event('error', f'Error getting process list: {str(e)}')
+        _proc_cache['t'] = now
+        _proc_cache['data'] = processes
+        return processes
+
 def get_process_list():
-    """Get process list with error handling"""
-    processes = []
-    try:
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'username']):
-            try:
-                pinfo = proc.as_dict(['pid', 'name', 'cpu_percent', 'memory_percent', 'username'])
-                if pinfo['cpu_percent'] is not None:
-                    processes.append(pinfo)
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
-    except Exception as e:
-        log_system_event('error', f'Error getting process list: {str(e)}')
-    return sorted(
-        [p for p in processes if p['cpu_percent'] is not None],
-        key=lambda x: x['cpu_percent'],
-        reverse=True
-    )[:10]
+    """Get the full process list sorted by CPU usage; the client windows
+    the rendering, so no need to truncate server-side"""
+    return sorted(_scan_processes(), key=lambda x: x['cpu_percent'], reverse=True)
 
-def get_system_info():
-    """Get system information with error handling"""
+def _compute_snapshot():
+    """Sample all system metrics once and push them into the histories"""
     try:
-        # CPU Information
-        cpu_percent = psutil.cpu_percent(interval=0.5)
-        cpu_cores = psutil.cpu_count()
-        cpu_freq = psutil.cpu_freq().current / 1000 if psutil.cpu_freq() else 0
+        # CPU Information (non-blocking: delta since the last sample)
+        cpu_percent = psutil.cpu_percent(interval=None)
+        cpu_per_core = psutil.cpu_percent(interval=None, percpu=True)
+        cpu_cores = _CPU_CORES
+        freq = psutil.cpu_freq()
+        cpu_freq = freq.current / 1000 if freq else 0
         
         # Memory Information
         memory = psutil.virtual_memory()
@@ -129,43 +301,28 @@ def get_system_info():
         system_state['last_network'] = network
         system_state['last_time'] = time.time()
         
-        # Temperature Information
-        temperatures = []
-        try:
-            if hasattr(psutil, 'sensors_temperatures'):
-                temps = psutil.sensors_temperatures()
-                for name, entries in temps.items():
-                    for entry in entries:
-                        temperatures.append({
-                            'label': name,
-                            'current': entry.current,
-                            'high': entry.high or 100
-                        })
-                system_state['temperature_data'] = temperatures
-        except Exception as e:
-            log_system_event('warning', f'Could not get temperature readings: {str(e)}')
-        
-        # Disk Partition Information
-        disk_partitions = []
-        try:
-            partitions = psutil.disk_partitions()
-            for partition in partitions:
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    disk_partitions.append({
-                        'device': partition.device,
-                        'mountpoint': partition.mountpoint,
-                        'fstype': partition.fstype,
-                        'total': humanize.naturalsize(usage.total),
-                        'used': humanize.naturalsize(usage.used),
-                        'free': humanize.naturalsize(usage.free),
-                        'percent': round((usage.used / usage.total) * 100, 2)
-                    })
-                except PermissionError:
-                    continue
-            system_state['disk_data'] = disk_partitions
-        except Exception as e:
-            log_system_event('warning', f'Could not get disk partitions: {str(e)}')
+        # Temperature Information (sensors change slowly; re-read on a TTL)
+        now = time.time()
+        if now - system_state['last_temperature_check'] > TEMP_TTL:
+            temperatures = []
+            try:
+                if hasattr(psutil, 'sensors_temperatures'):
+                    temps = psutil.sensors_temperatures()
+                    for name, entries in temps.items():
+                        for entry in entries:
+                            temperatures.append({
+                                'label': name,
+                                'current': entry.current,
+                                'high': entry.high or 100
+                            })
+                    system_state['temperature_data'] = temperatures
+                system_state['last_temperature_check'] = now
+            except Exception as e:
+                log_system_event('warning', f'Could not get temperature readings: {str(e)}')
+        temperatures = system_state['temperature_data']
+
+        # Disk Partition Information (statvfs per mount; cached on a TTL)
+        disk_partitions = _compute_disk_partitions()
         
         # System Alerts
         alerts = []
@@ -189,21 +346,42 @@ def get_system_info():
             })
         
         # Add to history
-        cpu_history.append(cpu_percent)
-        memory_history.append(memory.percent)
-        network_history.append(system_state['network_stats'])
-        temperature_history.append(temperatures)
-        disk_history.append(disk_partitions)
+        cpu_history.push(cpu_percent)
+        memory_history.push(memory.percent)
+        network_sent_history.push(system_state['network_stats']['bytes_sent_per_sec'])
+        network_recv_history.push(system_state['network_stats']['bytes_recv_per_sec'])
+        # Histories keep scalars only (matching cpu/memory): storing the full
+        # per-sensor/per-partition dict lists would alias mutable data into
+        # the buffers and give the GC 60 deep structures to scan
+        temperature_history.push(max((t['current'] for t in temperatures), default=0))
+        disk_history.push(max((p['percent'] for p in disk_partitions), default=0))
         
+        net = system_state['network_stats']
         return {
             'cpu_percent': cpu_percent,
+            'cpu_per_core': cpu_per_core,
             'cpu_cores': cpu_cores,
             'cpu_freq': round(cpu_freq, 2),
-            'memory': memory._asdict(),
-            'disk': disk._asdict(),
+            # Humanized strings ride along with the raw numbers so clients
+            # skip N format calls per refresh
+            'memory': {
+                **memory._asdict(),
+                'used_human': _human(memory.used),
+                'available_human': _human(memory.available),
+                'total_human': _human(memory.total)
+            },
+            'disk': {
+                **disk._asdict(),
+                'used_human': _human(disk.used),
+                'total_human': _human(disk.total)
+            },
             'uptime': uptime,
             'boot_time': boot_time.strftime('%Y-%m-%d %H:%M:%S'),
-            'network': system_state['network_stats'],
+            'network': {
+                **net,
+                'recv_human': _human(int(net['bytes_recv_per_sec'])),
+                'sent_human': _human(int(net['bytes_sent_per_sec']))
+            },
             'temperatures': temperatures,
             'alerts': alerts,
             'disk_partitions': disk_partitions
@@ -212,89 +390,107 @@ def get_system_info():
         log_system_event('error', f'Error getting system info: {str(e)}')
         return {}
 
-def get_file_list(path):
-    """Get file list with error handling"""
+def get_system_info():
+    """Get the latest sampled system information"""
+    snap = CURRENT_SNAPSHOT
+    if snap:
+        return snap
+    # Sampler hasn't produced a snapshot yet (or isn't running, e.g. when
+    # the app is embedded); fall back to sampling inline
+    return _compute_snapshot()
+
+_FILE_SORT_KEYS = {
+    'name': lambda x: (x['type'] != 'directory', x['name'].lower()),
+    'modified': lambda x: (x['type'] != 'directory', x['modified'])
+}
+
+def get_file_list(path, offset=0, limit=200, sort='name'):
+    """Get one page of a directory listing with error handling"""
     try:
         files = []
-        for item in os.listdir(path):
-            full_path = os.path.join(path, item)
-            try:
-                stat = os.stat(full_path)
-                files.append({
-                    'name': item,
-                    'path': full_path,
-                    'type': 'directory' if os.path.isdir(full_path) else 'file',
-                    'size': humanize.naturalsize(stat.st_size) if not os.path.isdir(full_path) else '-',
-                    'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                    'permissions': oct(stat.st_mode)[-3:]
-                })
-            except (PermissionError, FileNotFoundError):
-                continue
-        return sorted(files, key=lambda x: (x['type'] != 'directory', x['name'].lower()))[:20]
+        # scandir exposes is_dir()/stat() from cached dirent data, so this
+        # is one stat per entry instead of the two os.listdir needed
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    stat = entry.stat()
+                    is_dir = entry.is_dir()
+                    files.append({
+                        'name': entry.name,
+                        'path': entry.path,
+                        'type': 'directory' if is_dir else 'file',
+                        'size': '-' if is_dir else _human(stat.st_size),
+                        'modified': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(stat.st_mtime)),
+                        'permissions': oct(stat.st_mode)[-3:]
+                    })
+                except (PermissionError, FileNotFoundError, OSError):
+                    continue
+        key = _FILE_SORT_KEYS.get(sort, _FILE_SORT_KEYS['name'])
+        # nsmallest keeps only the entries up to the end of the requested
+        # page: O(n log(offset+limit)) instead of sorting the whole
+        # directory, which matters for multi-thousand-entry dirs
+        page = heapq.nsmallest(offset + limit, files, key=key)[offset:]
+        return {'total': len(files), 'entries': page}
     except Exception as e:
         log_system_event('error', f'Error accessing {path}: {str(e)}')
-        return []
+        return {'total': 0, 'entries': []}
 
 def get_system_performance_data():
     """Get performance data for charts"""
+    sent = network_sent_history.snapshot()
+    recv = network_recv_history.snapshot()
     return {
-        'cpu_history': list(cpu_history),
-        'memory_history': list(memory_history),
-        'network_history': list(network_history)
+        'cpu_history': cpu_history.snapshot(),
+        'memory_history': memory_history.snapshot(),
+        'network_history': [
+            {'bytes_sent_per_sec': s, 'bytes_recv_per_sec': r}
+            for s, r in zip(sent, recv)
+        ],
+        'cpu_stats': cpu_history.stats(),
+        'memory_stats': memory_history.stats()
     }
 
 def get_top_processes_by_memory():
     """Get top processes by memory usage"""
-    processes = []
-    try:
-        for proc in psutil.process_iter(['pid', 'name', 'memory_percent']):
-            try:
-                pinfo = proc.as_dict(['pid', 'name', 'memory_percent'])
-                if pinfo['memory_percent'] is not None:
-                    processes.append(pinfo)
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
-    except Exception as e:
-        log_system_event('error', f'Error getting process list: {str(e)}')
-    return sorted(
-        [p for p in processes if p['memory_percent'] is not None],
-        key=lambda x: x['memory_percent'],
-        reverse=True
-    )[:10]
+    return heapq.nlargest(10, _scan_processes(), key=lambda x: x['memory_percent'])
 
 def get_top_processes_by_cpu():
     """Get top processes by CPU usage"""
-    processes = []
-    try:
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
-            try:
-                pinfo = proc.as_dict(['pid', 'name', 'cpu_percent'])
-                if pinfo['cpu_percent'] is not None:
-                    processes.append(pinfo)
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
-    except Exception as e:
-        log_system_event('error', f'Error getting process list: {str(e)}')
-    return sorted(
-        [p for p in processes if p['cpu_percent'] is not None],
-        key=lambda x: x['cpu_percent'],
-        reverse=True
-    )[:10]
+    return heapq.nlargest(10, _scan_processes(), key=lambda x: x['cpu_percent'])
+
+# psutil may not expose AF_INET on every platform; fall back to the
+# canonical socket constant. Invariant, so resolve it once at import.
+_AF_INET = getattr(psutil, 'AF_INET', socket.AF_INET)
+
+def ttl_cache(ttl):
+    """Memoize a zero-argument sampler for a short TTL, so concurrent
+    polls inside the same window share one set of syscalls"""
+    def deco(fn):
+        lock = threading.Lock()
+        last = [0.0, None]
+
+        @wraps(fn)
+        def wrapper():
+            with lock:
+                now = time.monotonic()
+                if now - last[0] < ttl:
+                    return last[1]
+                value = fn()
+                last[0] = now
+                last[1] = value
+                return value
+        return wrapper
+    return deco
 
+@ttl_cache(0.5)
 def get_network_interfaces():
     """Get network interface information"""
     try:
         interfaces = psutil.net_if_addrs()
         interface_data = []
-        # Handle the case where AF_INET might not be available
-        af_inet = getattr(psutil, 'AF_INET', None)
-        if af_inet is None:
-            # Fallback to a known constant if AF_INET is not defined
-            af_inet = 2  # This is the standard value for AF_INET on most platforms
-        
         for interface_name, interface_addresses in interfaces.items():
             for address in interface_addresses:
-                if address.family == af_inet:
+                if address.family == _AF_INET:
                     interface_data.append({
                         'name': interface_name,
                         'ip': address.address,
@@ -308,27 +504,7 @@ def get_network_interfaces():
 
 def get_disk_partitions():
     """Get disk partition information"""
-    try:
-        partitions = psutil.disk_partitions()
-        partition_data = []
-        for partition in partitions:
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                partition_data.append({
-                    'device': partition.device,
-                    'mountpoint': partition.mountpoint,
-                    'fstype': partition.fstype,
-                    'total': humanize.naturalsize(usage.total),
-                    'used': humanize.naturalsize(usage.used),
-                    'free': humanize.naturalsize(usage.free),
-                    'percent': round((usage.used / usage.total) * 100, 2)
-                })
-            except PermissionError:
-                continue
-        return partition_data
-    except Exception as e:
-        log_system_event('error', f'Error getting disk partitions: {str(e)}')
-        return []
+    return _compute_disk_partitions()
 
 def get_system_uptime():
     """Get detailed system uptime information"""
@@ -349,20 +525,26 @@ def get_system_uptime():
         log_system_event('error', f'Error getting system uptime: {str(e)}')
         return {}
 
+# platform.* never changes for the process lifetime (and can shell out
+# on some systems), so snapshot it once at import
+_USER_INFO_STATIC = {
+    'system': platform.system(),
+    'release': platform.release(),
+    'machine': platform.machine(),
+    'processor': platform.processor()
+}
+
+@lru_cache(maxsize=1)
 def get_user_info():
-    """Get current user information"""
+    """Get current user information; nothing here can change during the
+    process lifetime, so the dict is built exactly once"""
     try:
-        return {
-            'username': os.getlogin(),
-            'system': platform.system(),
-            'release': platform.release(),
-            'machine': platform.machine(),
-            'processor': platform.processor()
-        }
-    except Exception as e:
-        log_system_event('error', f'Error getting user info: {str(e)}')
-        return {}
+        username = os.getlogin()
+    except OSError:
+        username = os.environ.get('USER', 'unknown')
+    return {'username': username, **_USER_INFO_STATIC}
 
+@ttl_cache(0.5)
 def get_system_load_avg():
     """Get system load average (Linux/macOS only)"""
     try:
@@ -379,28 +561,24 @@ def get_system_load_avg():
         log_system_event('error', f'Error getting load average: {str(e)}')
         return None
 
-def get_system_resources():
+def sample_all():
+    """Capture one coherent sample for handlers that combine several
+    views: the published snapshot plus the shared process scan, taken
+    together so a response never straddles a sampler tick. Both reads
+    hit caches, so this adds no /proc traffic of its own"""
+    return {
+        'system_info': get_system_info(),
+        'processes': _scan_processes()
+    }
+
+def get_system_resources(sample=None):
     """Get comprehensive system resources information"""
     try:
-        # Get all process details
-        processes = []
-        try:
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'username']):
-                try:
-                    pinfo = proc.as_dict(['pid', 'name', 'cpu_percent', 'memory_percent', 'username'])
-                    if pinfo['cpu_percent'] is not None:
-                        processes.append(pinfo)
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
-        except Exception as e:
-            log_system_event('error', f'Error getting process list: {str(e)}')
-        
-        # Get current system info
-        system_info = get_system_info()
-        
+        if sample is None:
+            sample = sample_all()
         return {
-            'processes': processes,
-            'system_info': system_info,
+            'processes': sample['processes'],
+            'system_info': sample['system_info'],
             'timestamp': datetime.now().isoformat()
         }
     except Exception as e:
@@ -487,7 +665,13 @@ HTML_TEMPLATE = """
             background-color: var(--border-color);
         }
         .progress-bar {
-            transition: width 0.3s ease;
+            /* Bars scale on the compositor; animating width would force a
+               layout pass on every refresh */
+            width: 100%;
+            transform-origin: left center;
+            transform: scaleX(0);
+            transition: transform 0.3s ease;
+            will-change: transform;
         }
         .chart-container {
             height: 200px;
@@ -592,6 +776,10 @@ HTML_TEMPLATE = """
         .resource-card {
             border-left: 4px solid var(--accent-color);
         }
+        .core-cell {
+            width: 56px;
+            margin: 0 6px 4px 0;
+        }
         .resource-card.warning {
             border-left: 4px solid var(--warning-color);
         }
@@ -642,11 +830,25 @@ HTML_TEMPLATE = """
             font-size: 0.875rem;
             color: var(--text-color);
         }
+        .process-table {
+            /* Fixed layout keeps column widths independent of cell content,
+               so a refresh never triggers a whole-table width recalc */
+            table-layout: fixed;
+        }
         .process-table th {
             font-size: 0.75rem;
         }
         .process-table td {
             font-size: 0.75rem;
+            overflow: hidden;
+            text-overflow: ellipsis;
+            white-space: nowrap;
+        }
+        .process-table tbody tr {
+            /* Browsers that support it skip layout/paint for rows outside
+               the viewport; the intrinsic size matches PROC_ROW_HEIGHT */
+            content-visibility: auto;
+            contain-intrinsic-size: 0 33px;
         }
         .memory-breakdown {
             display: flex;
@@ -662,10 +864,14 @@ HTML_TEMPLATE = """
         }
         .memory-used {
             height: 100%;
+            width: 100%;
+            transform-origin: left center;
             background-color: var(--success-color);
         }
         .memory-free {
             height: 100%;
+            width: 100%;
+            transform-origin: left center;
             background-color: var(--primary-color);
         }
         .memory-available {
@@ -687,6 +893,8 @@ HTML_TEMPLATE = """
         }
         .disk-usage {
             height: 100%;
+            width: 100%;
+            transform-origin: left center;
             background-color: var(--warning-color);
         }
         .disk-free {
@@ -941,7 +1149,24 @@ HTML_TEMPLATE = """
                                         </tr>
                                     </thead>
                                     <tbody id="file-list"></tbody>
+                                    <template id="file-row">
+                                        <tr>
+                                            <td><i></i><span></span></td>
+                                            <td></td>
+                                            <td>
+                                                <button class="btn btn-sm btn-outline-primary" data-action="open" hidden>
+                                                    <i class="bi bi-folder-open"></i>
+                                                </button>
+                                                <button class="btn btn-sm btn-outline-danger" data-action="delete">
+                                                    <i class="bi bi-trash"></i>
+                                                </button>
+                                            </td>
+                                        </tr>
+                                    </template>
                                 </table>
+                                <button class="btn btn-sm btn-outline-secondary w-100 mb-2" id="file-load-more" hidden>
+                                    Load more
+                                </button>
                             </div>
                         </div>
                     </div>
@@ -1112,7 +1337,7 @@ HTML_TEMPLATE = """
     </div>
     
     <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    {% if push_enabled == 'true' %}<script src="https://cdn.socket.io/4.7.5/socket.io.min.js"></script>{% endif %}
     <script>
         // Theme Management
         const currentTheme = localStorage.getItem('theme') || 'light';
@@ -1131,238 +1356,355 @@ HTML_TEMPLATE = """
             icon.className = theme === 'light' ? 'bi bi-moon-stars-fill' : 'bi bi-sun-fill';
         }
         
+        // Element registry: the refresh paths touch these nodes dozens of
+        // times a second, so look each one up once instead of per write
+        const els = {};
+        function initElementRegistry() {
+            [
+                'cpu-percent-display', 'memory-percent-display', 'disk-percent-display',
+                'network-download-display', 'network-upload-display', 'uptime-display',
+                'cpu-bar', 'cpu-percent', 'cpu-cores',
+                'memory-bar', 'memory-percent', 'memory-details',
+                'disk-bar', 'disk-percent', 'disk-details',
+                'uptime', 'boot-time', 'network-download', 'network-upload',
+                'temperature-stats', 'system-alerts',
+                'cpu-card', 'memory-card', 'disk-card', 'current-time',
+                'all-processes', 'process-list', 'cpu-processes-list',
+                'memory-processes-list', 'system-log'
+            ].forEach(id => {
+                els[id.replace(/-([a-z])/g, (_, c) => c.toUpperCase())] = document.getElementById(id);
+            });
+        }
+
         // Global variables
         let deleteModal;
         let fileToDelete = null;
-        let networkChart;
-        let performanceChart;
-        let resourceChart;
+        const networkChart = {
+            rx: new Float32Array(30),
+            tx: new Float32Array(30),
+            head: 0,
+            ctx: null,
+            draw() {
+                if (!this.ctx) return;
+                const ctx = this.ctx;
+                ctx.clearRect(0, 0, ctx.canvas.width, ctx.canvas.height);
+                let max = 1;
+                for (let i = 0; i < this.rx.length; i++) {
+                    if (this.rx[i] > max) max = this.rx[i];
+                    if (this.tx[i] > max) max = this.tx[i];
+                }
+                drawSeries(ctx, this.rx, this.head, 'rgb(75, 192, 192)', max);
+                drawSeries(ctx, this.tx, this.head, 'rgb(255, 99, 132)', max);
+            }
+        };
+        const performanceChart = {
+            cpu: new Float32Array(60),
+            mem: new Float32Array(60),
+            head: 0,
+            lastCpu: -1,
+            lastMem: -1,
+            ctx: null,
+            draw() {
+                if (!this.ctx) return;
+                const ctx = this.ctx;
+                ctx.clearRect(0, 0, ctx.canvas.width, ctx.canvas.height);
+                drawSeries(ctx, this.cpu, this.head, 'rgb(54, 162, 235)', 100);
+                drawSeries(ctx, this.mem, this.head, 'rgb(255, 99, 132)', 100);
+            }
+        };
+        const resourceChart = {
+            values: [0, 0, 0],
+            colors: ['rgba(54, 162, 235, 0.7)', 'rgba(255, 99, 132, 0.7)', 'rgba(255, 159, 64, 0.7)'],
+            ctx: null,
+            draw() {
+                if (!this.ctx) return;
+                const ctx = this.ctx;
+                const W = ctx.canvas.width, H = ctx.canvas.height;
+                ctx.clearRect(0, 0, W, H);
+                const slot = W / this.values.length;
+                for (let i = 0; i < this.values.length; i++) {
+                    const h = (this.values[i] / 100) * (H - 4);
+                    ctx.fillStyle = this.colors[i];
+                    ctx.fillRect(i * slot + slot * 0.2, H - h, slot * 0.6, h);
+                }
+            }
+        };
         document.addEventListener('DOMContentLoaded', function() {
+            initElementRegistry();
+            topCpuRows = buildTopRows(els.cpuProcessesList);
+            topMemRows = buildTopRows(els.memoryProcessesList);
             deleteModal = new bootstrap.Modal(document.getElementById('deleteModal'));
-            initializeNetworkChart();
-            initializePerformanceChart();
-            initializeResourceChart();
-            updateSystemInfo();
-            updateFileList();
-            updateProcesses();
-            updateSystemLog();
-            updateSystemInfoTab();
-            updateResourcesTab();
-            updateDiskTab();
-            setInterval(updateSystemInfo, {{ refresh_interval }});
-            setInterval(updateProcesses, 5000);
-            setInterval(updateSystemLog, 2000);
-            setInterval(updateCurrentTime, 1000);
-            setInterval(updatePerformanceHistory, 10000);
-            setInterval(updateResourcesTab, 10000);
-            setInterval(updateDiskTab, 30000);
+            els.allProcesses.addEventListener('scroll', onProcessListScroll);
+            // One delegated listener instead of an inline onclick per row:
+            // row rebuilds stay pure string work with no handler re-parsing
+            els.processList.addEventListener('click', e => {
+                const btn = e.target.closest('button[data-pid]');
+                if (btn) killProcess(+btn.dataset.pid);
+            });
+            document.getElementById('file-load-more').addEventListener('click',
+                () => updateFileList(fileEntries.length));
+            // Same delegation for the file table's open/delete buttons
+            document.getElementById('file-list').addEventListener('click', e => {
+                const btn = e.target.closest('button[data-action]');
+                if (!btn) return;
+                const path = btn.closest('tr').dataset.path;
+                if (btn.dataset.action === 'open') navigateToDirectory(path);
+                else deleteFile(path);
+            });
+            // Split startup into separate scheduler tasks so the browser
+            // can interleave input and paint instead of running three chart
+            // constructors plus seven fetch-and-render passes in one long
+            // task. Content for hidden tabs initializes at low priority.
+            const yieldy = (fn, priority = 'user-visible') =>
+                ('scheduler' in window) ? scheduler.postTask(fn, { priority }) : setTimeout(fn, 0);
+            yieldy(initializeNetworkChart);
+            yieldy(initializePerformanceChart);
+            yieldy(updateSystemInfo);
+            yieldy(updateProcesses);
+            yieldy(initPushChannel);
+            yieldy(initializeResourceChart, 'background');
+            yieldy(updateFileList, 'background');
+            yieldy(updateSystemInfoTab, 'background');
+            yieldy(updateResourcesTab, 'background');
+            yieldy(updateDiskTab, 'background');
+            // Refresh only the tab the user is looking at; switching tabs
+            // moves the timer over (with an immediate refresh)
+            document.querySelectorAll('[data-bs-toggle="tab"]').forEach(btn =>
+                btn.addEventListener('shown.bs.tab', e => activateTabRefresher(e.target.dataset.bsTarget)));
+            activateTabRefresher('#processes');
+            requestAnimationFrame(visualTick);
         });
+
+        // Per-tab refreshers: the overview cards outside the tabs stay on
+        // the always-on visual loop, but tab content only polls while its
+        // tab is shown
+        const tabRefreshers = {
+            '#processes': { fn: updateProcesses, period: 5000 },
+            '#system-info': { fn: updateSystemInfoTab, period: 10000 },
+            '#resources': { fn: updateResourcesTab, period: 10000 },
+            '#disk': { fn: updateDiskTab, period: 30000 }
+        };
+        let activeTab = '#processes';
+        // Each activation bumps the generation counter, which orphans any
+        // loop scheduled for a previous tab; the loop itself reschedules
+        // after its fetch settles, doubling the delay (capped at 60 s) on
+        // consecutive errors so a down server is not hammered
+        let tabGen = 0;
+        function activateTabRefresher(target) {
+            activeTab = target;
+            tabGen++;
+            if (target === '#logs') openLogStream();
+            else closeLogStream();
+            const refresher = tabRefreshers[target];
+            if (!refresher) return;
+            const gen = tabGen;
+            let fails = 0;
+            const run = () => {
+                if (gen !== tabGen) return;
+                if (document.hidden) {
+                    setTimeout(run, refresher.period);
+                    return;
+                }
+                Promise.resolve(refresher.fn())
+                    .then(() => { fails = 0; })
+                    .catch(() => { fails++; })
+                    .finally(() => {
+                        if (gen !== tabGen) return;
+                        setTimeout(run, Math.min(refresher.period * 2 ** fails, 60000));
+                    });
+            };
+            run();
+        }
+
+        // The rAF loop already stalls in hidden tabs; the poll loop idles
+        // too (document.hidden check above), and re-showing the page
+        // restarts the active tab's refresher for an immediate update
+        document.addEventListener('visibilitychange', () => {
+            if (document.hidden) {
+                closeLogStream();
+            } else {
+                activateTabRefresher(activeTab);
+                // Draw anything that went dirty while the page was hidden
+                if (chartDirty.size && !chartFlushQueued) {
+                    chartFlushQueued = true;
+                    requestAnimationFrame(flushCharts);
+                }
+            }
+        });
+
+        // One requestAnimationFrame loop replaces the per-task visual
+        // timers: each sub-task fires when its own period has elapsed, and
+        // nothing runs at all while the tab is hidden
+        const REFRESH_INTERVAL_MS = {{ refresh_interval }};
+        const PUSH_ENABLED = {{ push_enabled }};
+
+        // While the push channel is up, server ticks drive the system-info
+        // and process views and the matching polls are skipped; polling
+        // resumes automatically if the socket drops
+        let pushConnected = false;
+        function initPushChannel() {
+            if (!PUSH_ENABLED || typeof io === 'undefined') return;
+            const sock = io();
+            sock.on('connect', () => { pushConnected = true; });
+            sock.on('disconnect', () => { pushConnected = false; });
+            sock.on('tick', d => {
+                if (document.hidden) return;
+                requestAnimationFrame(() => applySystemInfo(d.sys));
+                allProcs = d.procs.all;
+                renderAllProcesses();
+                renderTopTable(topCpuRows, d.procs.topCpu, 'cpu_percent');
+                renderTopTable(topMemRows, d.procs.topMem, 'memory_percent');
+            });
+        }
+        const tickLast = { time: 0, sys: 0 };
+        function visualTick(now) {
+            if (document.hidden) {
+                requestAnimationFrame(visualTick);
+                return;
+            }
+            if (now - tickLast.time > 1000) {
+                tickLast.time = now;
+                updateCurrentTime();
+            }
+            if (now - tickLast.sys > REFRESH_INTERVAL_MS) {
+                tickLast.sys = now;
+                if (!pushConnected) updateSystemInfo();
+            }
+            requestAnimationFrame(visualTick);
+        }
         
         function updateCurrentTime() {
-            document.getElementById('current-time').textContent = 
+            els.currentTime.textContent = 
                 new Date().toLocaleTimeString();
         }
         
-        function initializeNetworkChart() {
-            const ctx = document.getElementById('networkChart').getContext('2d');
-            networkChart = new Chart(ctx, {
-                type: 'line',
-                data: {
-                    labels: Array.from({length: 30}, (_, i) => ''),
-                    datasets: [{
-                        label: 'Download',
-                        data: Array(30).fill(0),
-                        borderColor: 'rgb(75, 192, 192)',
-                        backgroundColor: 'rgba(75, 192, 192, 0.2)',
-                        tension: 0.1,
-                        fill: true
-                    }, {
-                        label: 'Upload',
-                        data: Array(30).fill(0),
-                        borderColor: 'rgb(255, 99, 132)',
-                        backgroundColor: 'rgba(255, 99, 132, 0.2)',
-                        tension: 0.1,
-                        fill: true
-                    }]
-                },
-                options: {
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    plugins: {
-                        legend: {
-                            display: false
-                        }
-                    },
-                    scales: {
-                        y: {
-                            beginAtZero: true,
-                            ticks: {
-                                callback: function(value) {
-                                    return value + ' KB/s';
-                                }
-                            }
-                        }
-                    }
+        // Minimal canvas sparklines. The three charts only ever draw a
+        // 30/60-point polyline or three bars, which a few beginPath/lineTo
+        // calls render in microseconds -- no scales, legends, bezier
+        // tension or ResizeObserver machinery needed
+        function initCanvas(id) {
+            const canvas = document.getElementById(id);
+            canvas.width = canvas.clientWidth || 600;
+            canvas.height = canvas.clientHeight || 200;
+            return canvas.getContext('2d');
+        }
+
+        // Canvas backing stores are fixed-size; instead of observing every
+        // layout shift, resync them once after window resizes settle
+        let resizeTimer = null;
+        window.addEventListener('resize', () => {
+            clearTimeout(resizeTimer);
+            resizeTimer = setTimeout(() => {
+                for (const chart of [networkChart, performanceChart, resourceChart]) {
+                    if (!chart.ctx) continue;
+                    const canvas = chart.ctx.canvas;
+                    canvas.width = canvas.clientWidth || 600;
+                    canvas.height = canvas.clientHeight || 200;
+                    chart.draw();
                 }
-            });
+            }, 200);
+        });
+
+        function drawSeries(ctx, series, head, color, max) {
+            const W = ctx.canvas.width, H = ctx.canvas.height;
+            const n = series.length;
+            ctx.strokeStyle = color;
+            ctx.lineWidth = 2;
+            ctx.beginPath();
+            for (let i = 0; i < n; i++) {
+                const v = series[(head + i) % n];
+                const x = i * W / (n - 1);
+                const y = H - 1 - (v / max) * (H - 2);
+                if (i === 0) ctx.moveTo(x, y); else ctx.lineTo(x, y);
+            }
+            ctx.stroke();
         }
-        
+
+        function initializeNetworkChart() {
+            networkChart.ctx = initCanvas('networkChart');
+            networkChart.draw();
+        }
+
         function initializePerformanceChart() {
-            const ctx = document.getElementById('performanceChart').getContext('2d');
-            performanceChart = new Chart(ctx, {
-                type: 'line',
-                data: {
-                    labels: Array.from({length: 60}, (_, i) => ''),
-                    datasets: [
-                        {
-                            label: 'CPU (%)',
-                            data: Array(60).fill(0),
-                            borderColor: 'rgb(54, 162, 235)',
-                            backgroundColor: 'rgba(54, 162, 235, 0.2)',
-                            tension: 0.1,
-                            fill: true
-                        },
-                        {
-                            label: 'Memory (%)',
-                            data: Array(60).fill(0),
-                            borderColor: 'rgb(255, 99, 132)',
-                            backgroundColor: 'rgba(255, 99, 132, 0.2)',
-                            tension: 0.1,
-                            fill: true
-                        }
-                    ]
-                },
-                options: {
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    plugins: {
-                        legend: {
-                            display: true
-                        }
-                    },
-                    scales: {
-                        y: {
-                            beginAtZero: true,
-                            max: 100,
-                            ticks: {
-                                callback: function(value) {
-                                    return value + '%';
-                                }
-                            }
-                        }
-                    }
-                }
-            });
+            performanceChart.ctx = initCanvas('performanceChart');
+            performanceChart.draw();
         }
-        
+
         function initializeResourceChart() {
-            const ctx = document.getElementById('resourceChart').getContext('2d');
-            resourceChart = new Chart(ctx, {
-                type: 'bar',
-                data: {
-                    labels: ['CPU', 'Memory', 'Disk'],
-                    datasets: [{
-                        label: 'Utilization (%)',
-                        data: [0, 0, 0],
-                        backgroundColor: [
-                            'rgba(54, 162, 235, 0.7)',
-                            'rgba(255, 99, 132, 0.7)',
-                            'rgba(255, 159, 64, 0.7)'
-                        ],
-                        borderColor: [
-                            'rgba(54, 162, 235, 1)',
-                            'rgba(255, 99, 132, 1)',
-                            'rgba(255, 159, 64, 1)'
-                        ],
-                        borderWidth: 1
-                    }]
-                },
-                options: {
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    plugins: {
-                        legend: {
-                            display: false
-                        }
-                    },
-                    scales: {
-                        y: {
-                            beginAtZero: true,
-                            max: 100,
-                            ticks: {
-                                callback: function(value) {
-                                    return value + '%';
-                                }
-                            }
-                        }
-                    }
-                }
-            });
+            resourceChart.ctx = initCanvas('resourceChart');
+            resourceChart.draw();
         }
-        
+
         function updateSystemInfo() {
-            fetch('/api/system_info')
+            if (sysCtl) sysCtl.abort();
+            sysCtl = new AbortController();
+            fetch('/api/system_info', { signal: sysCtl.signal })
                 .then(response => response.json())
                 .then(data => {
-                    if (!data) return;
-                    
+                    if (!data || data.cpu_percent === undefined) return;
+                    // All DOM writes happen in one rAF callback so the
+                    // browser services a single rendering pass per refresh
+                    requestAnimationFrame(() => applySystemInfo(data));
+                })
+                .catch(error => {
+                    if (error.name !== 'AbortError') console.error('Error updating system info:', error);
+                });
+        }
+
+        function applySystemInfo(data) {
                     // Update overview stats
-                    document.getElementById('cpu-percent-display').textContent = data.cpu_percent.toFixed(1) + '%';
-                    document.getElementById('memory-percent-display').textContent = data.memory.percent.toFixed(1) + '%';
-                    document.getElementById('disk-percent-display').textContent = data.disk.percent.toFixed(1) + '%';
-                    document.getElementById('network-download-display').textContent = humanizeSize(data.network.bytes_recv_per_sec) + '/s';
-                    document.getElementById('network-upload-display').textContent = humanizeSize(data.network.bytes_sent_per_sec) + '/s';
-                    document.getElementById('uptime-display').textContent = data.uptime;
+                    els.cpuPercentDisplay.textContent = fix1(data.cpu_percent) + '%';
+                    els.memoryPercentDisplay.textContent = fix1(data.memory.percent) + '%';
+                    els.diskPercentDisplay.textContent = fix1(data.disk.percent) + '%';
+                    els.networkDownloadDisplay.textContent = data.network.recv_human + '/s';
+                    els.networkUploadDisplay.textContent = data.network.sent_human + '/s';
+                    els.uptimeDisplay.textContent = data.uptime;
                     
                     // Update detailed cards
                     // CPU
-                    document.getElementById('cpu-bar').style.width = data.cpu_percent + '%';
-                    document.getElementById('cpu-percent').textContent = data.cpu_percent.toFixed(1) + '%';
-                    document.getElementById('cpu-cores').textContent = `${data.cpu_cores} cores @ ${data.cpu_freq}GHz`;
+                    els.cpuBar.style.transform = `scaleX(${data.cpu_percent / 100})`;
+                    els.cpuPercent.textContent = fix1(data.cpu_percent) + '%';
+                    els.cpuCores.textContent = `${data.cpu_cores} cores @ ${data.cpu_freq}GHz`;
                     
                     // Memory
                     const memPercent = data.memory.percent;
-                    document.getElementById('memory-bar').style.width = memPercent + '%';
-                    document.getElementById('memory-percent').textContent = memPercent.toFixed(1) + '%';
-                    document.getElementById('memory-details').textContent = 
-                        `${humanizeSize(data.memory.used)} / ${humanizeSize(data.memory.total)}`;
+                    els.memoryBar.style.transform = `scaleX(${memPercent / 100})`;
+                    els.memoryPercent.textContent = fix1(memPercent) + '%';
+                    els.memoryDetails.textContent = 
+                        `${data.memory.used_human} / ${data.memory.total_human}`;
                     
                     // Disk
                     const diskPercent = data.disk.percent;
-                    document.getElementById('disk-bar').style.width = diskPercent + '%';
-                    document.getElementById('disk-percent').textContent = diskPercent.toFixed(1) + '%';
-                    document.getElementById('disk-details').textContent = 
-                        `${humanizeSize(data.disk.used)} / ${humanizeSize(data.disk.total)}`;
+                    els.diskBar.style.transform = `scaleX(${diskPercent / 100})`;
+                    els.diskPercent.textContent = fix1(diskPercent) + '%';
+                    els.diskDetails.textContent = 
+                        `${data.disk.used_human} / ${data.disk.total_human}`;
                     
                     // Uptime
-                    document.getElementById('uptime').textContent = data.uptime;
-                    document.getElementById('boot-time').textContent = data.boot_time;
+                    els.uptime.textContent = data.uptime;
+                    els.bootTime.textContent = data.boot_time;
                     
                     // Network
-                    document.getElementById('network-download').textContent = 
-                        humanizeSize(data.network.bytes_recv_per_sec) + '/s';
-                    document.getElementById('network-upload').textContent = 
-                        humanizeSize(data.network.bytes_sent_per_sec) + '/s';
+                    els.networkDownload.textContent = 
+                        data.network.recv_human + '/s';
+                    els.networkUpload.textContent = 
+                        data.network.sent_human + '/s';
                     
-                    // Update Network Chart
-                    if (networkChart.data.labels.length > 30) {
-                        networkChart.data.labels.shift();
-                        networkChart.data.datasets[0].data.shift();
-                        networkChart.data.datasets[1].data.shift();
-                    }
-                    networkChart.data.labels.push('');
-                    networkChart.data.datasets[0].data.push(data.network.bytes_recv_per_sec / 1024);
-                    networkChart.data.datasets[1].data.push(data.network.bytes_sent_per_sec / 1024);
-                    networkChart.update('none');
+                    // Update Network Chart: overwrite the oldest slot in
+                    // place; shift() re-indexes the whole array per refresh
+                    networkChart.rx[networkChart.head] = data.network.bytes_recv_per_sec / 1024;
+                    networkChart.tx[networkChart.head] = data.network.bytes_sent_per_sec / 1024;
+                    networkChart.head = (networkChart.head + 1) % networkChart.rx.length;
+                    queueChartUpdate(networkChart);
                     
                     // Temperature
-                    const tempContainer = document.getElementById('temperature-stats');
+                    const tempContainer = els.temperatureStats;
                     tempContainer.innerHTML = data.temperatures.map(temp => `
                         <div class="mb-2">
                             <small class="text-muted">${temp.label}</small>
                             <div class="progress" style="height: 8px;">
                                 <div class="progress-bar ${temp.current > temp.high ? 'bg-danger' : 'bg-success'}" 
-                                     style="width: ${(temp.current / temp.high * 100)}%">
+                                     style="transform: scaleX(${temp.current / temp.high})">
                                     ${temp.current}°C
                                 </div>
                             </div>
@@ -1370,7 +1712,7 @@ HTML_TEMPLATE = """
                     `).join('');
                     
                     // Alerts
-                    const alertContainer = document.getElementById('system-alerts');
+                    const alertContainer = els.systemAlerts;
                     alertContainer.innerHTML = data.alerts.map(alert => `
                         <div class="alert alert-${alert.type} alert-dismissible fade show alert-custom" role="alert">
                             <span class="status-indicator status-${alert.type === 'danger' ? 'danger' : 'warning'}"></span>
@@ -1379,96 +1721,156 @@ HTML_TEMPLATE = """
                         </div>
                     `).join('');
                     
-                    // Update card colors based on usage
-                    const cpuCard = document.getElementById('cpu-card');
-                    const memoryCard = document.getElementById('memory-card');
-                    const diskCard = document.getElementById('disk-card');
-                    const uptimeCard = document.getElementById('uptime-card');
-                    
-                    cpuCard.className = 'stat-card resource-card';
-                    memoryCard.className = 'stat-card resource-card';
-                    diskCard.className = 'stat-card resource-card';
-                    
-                    if (data.cpu_percent > 80) {
-                        cpuCard.classList.add('danger');
-                    } else if (data.cpu_percent > 60) {
-                        cpuCard.classList.add('warning');
-                    } else {
-                        cpuCard.classList.add('success');
-                    }
-                    
-                    if (data.memory.percent > 80) {
-                        memoryCard.classList.add('danger');
-                    } else if (data.memory.percent > 60) {
-                        memoryCard.classList.add('warning');
-                    } else {
-                        memoryCard.classList.add('success');
-                    }
-                    
-                    if (data.disk.percent > 80) {
-                        diskCard.classList.add('danger');
-                    } else if (data.disk.percent > 60) {
-                        diskCard.classList.add('warning');
-                    } else {
-                        diskCard.classList.add('success');
-                    }
-                })
+                    // Update card colors with a single className write per
+                    // card instead of reset-then-classList.add
+                    const usageLevel = v => v > 80 ? ' danger' : v > 60 ? ' warning' : ' success';
+                    els.cpuCard.className = 'stat-card resource-card' + usageLevel(data.cpu_percent);
+                    els.memoryCard.className = 'stat-card resource-card' + usageLevel(data.memory.percent);
+                    els.diskCard.className = 'stat-card resource-card' + usageLevel(data.disk.percent);
+        }
+        
+        // Cancel superseded requests: if the next tick fires before the
+        // previous response lands, the stale response would race the fresh
+        // one into the DOM and its parse work would be wasted
+        let procCtl, sysCtl;
+
+        // The process bundle can be hundreds of KB on busy hosts, and a
+        // synchronous JSON.parse of it is the page's longest main-thread
+        // task. Decode and parse it in a worker instead; the app is a
+        // single file, so the worker script ships as a Blob URL
+        const parseWorker = new Worker(URL.createObjectURL(new Blob([
+            'onmessage = e => postMessage(JSON.parse(new TextDecoder().decode(e.data)));'
+        ], { type: 'text/javascript' })));
+        parseWorker.onmessage = e => {
+            const { all, topCpu, topMem } = e.data;
+            // All processes: keep the data and window-render the table
+            allProcs = all;
+            renderAllProcesses();
+
+            // Top tables: diff by PID instead of rebuilding the tbody
+            renderTopTable(topCpuRows, topCpu, 'cpu_percent');
+            renderTopTable(topMemRows, topMem, 'memory_percent');
+        };
+
+        function updateProcesses() {
+            if (pushConnected) return;
+            if (procCtl) procCtl.abort();
+            procCtl = new AbortController();
+            return fetch('/api/processes_bundle', { signal: procCtl.signal })
+                .then(response => response.arrayBuffer())
+                .then(buf => parseWorker.postMessage(buf, [buf]))
                 .catch(error => {
-                    console.error('Error updating system info:', error);
+                    if (error.name !== 'AbortError') {
+                        console.error('Error updating processes:', error);
+                        throw error;
+                    }
                 });
         }
         
-        function updateProcesses() {
-            Promise.all([
-                fetch('/api/processes'),
-                fetch('/api/top_processes/cpu'),
-                fetch('/api/top_processes/memory')
-            ])
-            .then(responses => Promise.all(responses.map(r => r.json())))
-            .then(([allProcesses, cpuProcesses, memoryProcesses]) => {
-                // All processes
-                const tbody = document.getElementById('process-list');
-                tbody.innerHTML = allProcesses.map(process => `
-                    <tr>
-                        <td>${process.pid}</td>
-                        <td>${process.name}</td>
-                        <td>${process.cpu_percent.toFixed(1)}%</td>
-                        <td>${process.memory_percent.toFixed(1)}%</td>
-                        <td>${process.username || '-'}</td>
-                        <td>
-                            <button class="btn btn-sm btn-outline-danger" 
-                                    onclick="killProcess(${process.pid})">
-                                <i class="bi bi-x"></i>
-                            </button>
-                        </td>
-                    </tr>
-                `).join('');
-                
-                // Top CPU processes
-                const cpuTbody = document.getElementById('cpu-processes-list');
-                cpuTbody.innerHTML = cpuProcesses.map(process => `
-                    <tr>
-                        <td>${process.pid}</td>
-                        <td>${process.name}</td>
-                        <td>${process.cpu_percent.toFixed(1)}%</td>
-                    </tr>
-                `).join('');
-                
-                // Top memory processes
-                const memoryTbody = document.getElementById('memory-processes-list');
-                memoryTbody.innerHTML = memoryProcesses.map(process => `
-                    <tr>
-                        <td>${process.pid}</td>
-                        <td>${process.name}</td>
-                        <td>${process.memory_percent.toFixed(1)}%</td>
-                    </tr>
-                `).join('');
-            })
-            .catch(error => {
-                console.error('Error updating processes:', error);
+        // Coalesce chart redraws: responses from different endpoints can
+        // land in the same frame, so dirty charts are collected and each
+        // one re-renders at most once per animation frame. A hidden page
+        // keeps charts dirty without drawing; the pending set is flushed
+        // when the page becomes visible again
+        const chartDirty = new Set();
+        let chartFlushQueued = false;
+        function flushCharts() {
+            chartFlushQueued = false;
+            if (document.hidden) return;
+            chartDirty.forEach(c => c.draw());
+            chartDirty.clear();
+        }
+        function queueChartUpdate(chart) {
+            if (!chart) return;
+            chartDirty.add(chart);
+            if (!chartFlushQueued) {
+                chartFlushQueued = true;
+                requestAnimationFrame(flushCharts);
+            }
+        }
+
+        // One-decimal rounding via integer arithmetic; cheaper than toFixed
+        // when called once per rendered row
+        function fix1(x) {
+            return ((x * 10 + 0.5) | 0) / 10;
+        }
+
+        // The top-10 tables always show exactly TOP_N entries, so their
+        // rows are built once and reused forever; a refresh only rewrites
+        // cell text, and unused rows are hidden rather than removed
+        const TOP_N = 10;
+        let topCpuRows = null;
+        let topMemRows = null;
+        function buildTopRows(tbody) {
+            return Array.from({ length: TOP_N }, () => {
+                const tr = document.createElement('tr');
+                for (let j = 0; j < 3; j++) tr.appendChild(document.createElement('td'));
+                tr.hidden = true;
+                tbody.appendChild(tr);
+                return tr;
             });
         }
-        
+
+        function renderTopTable(rows, procs, field) {
+            for (let i = 0; i < TOP_N; i++) {
+                const tr = rows[i];
+                const p = procs[i];
+                if (!p) {
+                    tr.hidden = true;
+                    continue;
+                }
+                tr.hidden = false;
+                const cells = tr.children;
+                const pidText = String(p.pid);
+                const pctText = fix1(p[field]) + '%';
+                if (cells[0].textContent !== pidText) cells[0].textContent = pidText;
+                if (cells[1].textContent !== p.name) cells[1].textContent = p.name;
+                if (cells[2].textContent !== pctText) cells[2].textContent = pctText;
+            }
+        }
+
+        // Windowed rendering for the All Processes table: only the rows in
+        // (or near) the viewport exist in the DOM; spacer rows stand in for
+        // the rest so the scrollbar still reflects the full list
+        let allProcs = [];
+        const PROC_ROW_HEIGHT = 33;
+        const PROC_OVERSCAN = 5;
+        let procRenderQueued = false;
+
+        function renderAllProcesses() {
+            const container = els.allProcesses;
+            const tbody = els.processList;
+            const total = allProcs.length;
+            const start = Math.max(0, Math.floor(container.scrollTop / PROC_ROW_HEIGHT) - PROC_OVERSCAN);
+            const end = Math.min(total, start + Math.ceil(container.clientHeight / PROC_ROW_HEIGHT) + 2 * PROC_OVERSCAN);
+            // Preallocated parts array + plain concatenation: template
+            // literals allocate an intermediate string per substitution,
+            // and toFixed is slow relative to integer rounding
+            const parts = new Array(end - start + 2);
+            parts[0] = '<tr style="height: ' + (start * PROC_ROW_HEIGHT) + 'px"></tr>';
+            let k = 1;
+            for (let i = start; i < end; i++) {
+                const p = allProcs[i];
+                parts[k++] = '<tr style="height: ' + PROC_ROW_HEIGHT + 'px"><td>' + p.pid +
+                    '</td><td>' + p.name +
+                    '</td><td>' + fix1(p.cpu_percent) + '%</td><td>' + fix1(p.memory_percent) +
+                    '%</td><td>' + (p.username || '-') +
+                    '</td><td><button class="btn btn-sm btn-outline-danger" data-pid="' +
+                    p.pid + '"><i class="bi bi-x"></i></button></td></tr>';
+            }
+            parts[k] = '<tr style="height: ' + ((total - end) * PROC_ROW_HEIGHT) + 'px"></tr>';
+            tbody.innerHTML = parts.join('');
+        }
+
+        function onProcessListScroll() {
+            if (procRenderQueued) return;
+            procRenderQueued = true;
+            requestAnimationFrame(() => {
+                procRenderQueued = false;
+                renderAllProcesses();
+            });
+        }
+
         function killProcess(pid) {
             if (confirm(`Kill process ${pid}?`)) {
                 fetch('/api/kill_process', {
@@ -1488,38 +1890,64 @@ HTML_TEMPLATE = """
             }
         }
         
-        function updateFileList() {
+        // File rows are keyed by path: entries that persist between
+        // refreshes keep their <tr> and only changed cells are written.
+        // New rows are cloned from the #file-row <template>, so the row
+        // markup lives in the HTML and names are set via textContent
+        // (which also keeps odd filenames from being parsed as HTML)
+        const fileRowMap = new Map();
+        function buildFileRow(file) {
+            const tr = document.getElementById('file-row').content.firstElementChild.cloneNode(true);
+            tr.dataset.path = file.path;
+            tr.querySelector('[data-action="open"]').hidden = file.type !== 'directory';
+            return tr;
+        }
+
+        function renderFileList(files) {
+            const tbody = document.getElementById('file-list');
+            const seen = new Set();
+            files.forEach((file, i) => {
+                seen.add(file.path);
+                let tr = fileRowMap.get(file.path);
+                if (!tr) {
+                    tr = buildFileRow(file);
+                    fileRowMap.set(file.path, tr);
+                }
+                const nameTd = tr.children[0];
+                nameTd.firstElementChild.className = `bi bi-${file.type === 'directory' ? 'folder' : 'file'}`;
+                const nameText = ` ${file.name}`;
+                if (nameTd.lastElementChild.textContent !== nameText) nameTd.lastElementChild.textContent = nameText;
+                if (tr.children[1].textContent !== file.size) tr.children[1].textContent = file.size;
+                if (tbody.children[i] !== tr) tbody.insertBefore(tr, tbody.children[i] || null);
+            });
+            for (const [path, tr] of fileRowMap) {
+                if (!seen.has(path)) {
+                    tr.remove();
+                    fileRowMap.delete(path);
+                }
+            }
+        }
+
+        // Listings arrive in pages of 200; deeper entries load on demand
+        // so huge directories never produce a megabyte response or a
+        // thousand-row render
+        const FILE_PAGE = 200;
+        let fileEntries = [];
+        function updateFileList(offset = 0) {
             const path = document.getElementById('current-path').value;
-            fetch('/api/files?path=' + encodeURIComponent(path))
+            if (offset === 0) fileEntries = [];
+            return fetch(`/api/files?path=${encodeURIComponent(path)}&offset=${offset}&limit=${FILE_PAGE}`)
                 .then(response => response.json())
-                .then(files => {
-                    const tbody = document.getElementById('file-list');
-                    tbody.innerHTML = files.map(file => `
-                        <tr>
-                            <td>
-                                <i class="bi bi-${file.type === 'directory' ? 'folder' : 'file'}"></i>
-                                ${file.name}
-                            </td>
-                            <td>${file.size}</td>
-                            <td>
-                                ${file.type === 'directory' ? 
-                                    `<button class="btn btn-sm btn-outline-primary" 
-                                             onclick="navigateToDirectory('${file.path}')">
-                                        <i class="bi bi-folder-open"></i>
-                                    </button>` : ''}
-                                <button class="btn btn-sm btn-outline-danger" 
-                                        onclick="deleteFile('${file.path}')">
-                                    <i class="bi bi-trash"></i>
-                                </button>
-                            </td>
-                        </tr>
-                    `).join('');
+                .then(d => {
+                    fileEntries = fileEntries.concat(d.entries);
+                    renderFileList(fileEntries);
+                    document.getElementById('file-load-more').hidden = fileEntries.length >= d.total;
                 })
                 .catch(error => {
                     console.error('Error updating file list:', error);
                 });
         }
-        
+
         function navigateToDirectory(path) {
             document.getElementById('current-path').value = path;
             updateFileList();
@@ -1554,28 +1982,39 @@ HTML_TEMPLATE = """
             document.getElementById('permanentDelete').checked = false;
         });
         
-        function updateSystemLog() {
-            fetch('/api/system_log')
-                .then(response => response.json())
-                .then(logs => {
-                    const container = document.getElementById('system-log');
-                    container.innerHTML = logs.map(log => `
-                        <div class="log-entry ${log.level}">
-                            <small class="text-muted">[${log.timestamp}]</small>
-                            ${log.message}
-                        </div>
-                    `).join('');
-                    container.scrollTop = container.scrollHeight;
-                })
-                .catch(error => {
-                    console.error('Error updating system log:', error);
-                });
+        // Logs arrive over SSE: the server pushes only new entries, so
+        // nothing is fetched or re-rendered while the buffer is unchanged
+        let logStream = null;
+        let lastLogSeq = 0;
+        function openLogStream() {
+            if (logStream) return;
+            logStream = new EventSource('/api/system_log_stream');
+            logStream.onmessage = e => {
+                const log = JSON.parse(e.data);
+                // Replayed entries after a manual reopen are skipped by seq
+                if (log.seq <= lastLogSeq) return;
+                lastLogSeq = log.seq;
+                const div = document.createElement('div');
+                div.className = `log-entry ${log.level}`;
+                const ts = document.createElement('small');
+                ts.className = 'text-muted';
+                ts.textContent = `[${log.timestamp}] `;
+                div.appendChild(ts);
+                div.appendChild(document.createTextNode(log.message));
+                const container = els.systemLog;
+                container.appendChild(div);
+                while (container.childElementCount > 500) container.removeChild(container.firstChild);
+                container.scrollTop = container.scrollHeight;
+            };
+        }
+        function closeLogStream() {
+            if (logStream) {
+                logStream.close();
+                logStream = null;
+            }
         }
         
-        function updateSystemInfoTab() {
-            fetch('/api/system_info_extended')
-                .then(response => response.json())
-                .then(data => {
+        function renderSystemInfoTab(data) {
                     // System info table
                     const tableBody = document.getElementById('system-info-table');
                     tableBody.innerHTML = `
@@ -1603,54 +2042,79 @@ HTML_TEMPLATE = """
                             <td>${partition.percent}%</td>
                         </tr>
                     `).join('');
+        }
+
+        function renderPerformancePoint(data) {
+            const cpu = data.cpu_history.length > 0 ? data.cpu_history[data.cpu_history.length - 1] : 0;
+            const mem = data.memory_history.length > 0 ? data.memory_history[data.memory_history.length - 1] : 0;
+            // Idle hosts report near-identical samples tick after tick; a
+            // redraw of the same polyline buys nothing, so skip the ring
+            // write when both values sit within half a percent of the last
+            if (Math.abs(cpu - performanceChart.lastCpu) < 0.5 &&
+                Math.abs(mem - performanceChart.lastMem) < 0.5) return;
+            performanceChart.lastCpu = cpu;
+            performanceChart.lastMem = mem;
+            // Update performance chart via the same in-place ring write as
+            // the network chart
+            performanceChart.cpu[performanceChart.head] = cpu;
+            performanceChart.mem[performanceChart.head] = mem;
+            performanceChart.head = (performanceChart.head + 1) % performanceChart.cpu.length;
+            queueChartUpdate(performanceChart);
+        }
+
+        // One /api/batch round-trip per tab refresh; the server runs each
+        // underlying psutil sampler at most once per request even when two
+        // keys want the same data
+        function updateSystemInfoTab() {
+            return fetch('/api/batch?keys=sysinfo,perf')
+                .then(response => response.json())
+                .then(d => {
+                    renderSystemInfoTab(d.sysinfo);
+                    renderPerformancePoint(d.perf);
                 })
                 .catch(error => {
                     console.error('Error updating system info tab:', error);
+                    throw error;
                 });
         }
-        
-        function updatePerformanceHistory() {
-            fetch('/api/performance_history')
+
+        function updateResourcesTab() {
+            return fetch('/api/batch?keys=resources')
                 .then(response => response.json())
-                .then(data => {
-                    // Update performance chart
-                    if (performanceChart.data.labels.length > 60) {
-                        performanceChart.data.labels.shift();
-                        performanceChart.data.datasets[0].data.shift();
-                        performanceChart.data.datasets[1].data.shift();
-                    }
-                    performanceChart.data.labels.push('');
-                    performanceChart.data.datasets[0].data.push(data.cpu_history.length > 0 ? 
-                        data.cpu_history[data.cpu_history.length - 1] : 0);
-                    performanceChart.data.datasets[1].data.push(data.memory_history.length > 0 ? 
-                        data.memory_history[data.memory_history.length - 1] : 0);
-                    performanceChart.update('none');
-                })
+                .then(d => renderResourcesTab(d.resources))
                 .catch(error => {
-                    console.error('Error updating performance history:', error);
+                    console.error('Error updating resources tab:', error);
+                    throw error;
                 });
         }
-        
-        function updateResourcesTab() {
-            fetch('/api/resources')
+
+        function updateDiskTab() {
+            return fetch('/api/batch?keys=disks')
                 .then(response => response.json())
-                .then(data => {
+                .then(d => renderDiskTab(d.disks))
+                .catch(error => {
+                    console.error('Error updating disk tab:', error);
+                    throw error;
+                });
+        }
+
+        function renderResourcesTab(data) {
                     // Memory breakdown
                     const memoryBreakdown = document.getElementById('memory-breakdown');
                     if (data.system_info && data.system_info.memory) {
                         const mem = data.system_info.memory;
                         memoryBreakdown.innerHTML = `
                             <div class="memory-breakdown">
-                                <span>Used: ${humanizeSize(mem.used)}</span>
+                                <span>Used: ${mem.used_human}</span>
                                 <div class="memory-bar">
-                                    <div class="memory-used" style="width: ${(mem.used / mem.total * 100)}%"></div>
+                                    <div class="memory-used" style="transform: scaleX(${mem.used / mem.total})"></div>
                                 </div>
                                 <span>${Math.round((mem.used / mem.total) * 100)}%</span>
                             </div>
                             <div class="memory-breakdown">
-                                <span>Free: ${humanizeSize(mem.available)}</span>
+                                <span>Free: ${mem.available_human}</span>
                                 <div class="memory-bar">
-                                    <div class="memory-free" style="width: ${(mem.available / mem.total * 100)}%"></div>
+                                    <div class="memory-free" style="transform: scaleX(${mem.available / mem.total})"></div>
                                 </div>
                                 <span>${Math.round((mem.available / mem.total) * 100)}%</span>
                             </div>
@@ -1661,43 +2125,45 @@ HTML_TEMPLATE = """
                     const cpuBreakdown = document.getElementById('cpu-breakdown');
                     if (data.system_info) {
                         const cpuPercent = data.system_info.cpu_percent;
+                        const cores = data.system_info.cpu_per_core || [];
                         cpuBreakdown.innerHTML = `
                             <div class="progress mb-2">
-                                <div class="progress-bar bg-primary" style="width: ${cpuPercent}%"></div>
+                                <div class="progress-bar bg-primary" style="transform: scaleX(${cpuPercent / 100})"></div>
                             </div>
                             <div class="d-flex justify-content-between">
-                                <span>Used: ${cpuPercent.toFixed(1)}%</span>
-                                <span>Available: ${(100 - cpuPercent).toFixed(1)}%</span>
+                                <span>Used: ${fix1(cpuPercent)}%</span>
+                                <span>Available: ${fix1(100 - cpuPercent)}%</span>
+                            </div>
+                            <div class="d-flex flex-wrap mt-2">
+                                ${cores.map((core, i) => `
+                                    <div class="core-cell">
+                                        <small class="text-muted">${i}</small>
+                                        <div class="progress" style="height: 6px;">
+                                            <div class="progress-bar bg-primary" style="transform: scaleX(${core / 100})"></div>
+                                        </div>
+                                    </div>
+                                `).join('')}
                             </div>
                         `;
                     }
                     
                     // Update resource chart
-                    if (resourceChart) {
-                        resourceChart.data.datasets[0].data = [
-                            data.system_info?.cpu_percent || 0,
-                            data.system_info?.memory?.percent || 0,
-                            data.system_info?.disk?.percent || 0
-                        ];
-                        resourceChart.update();
-                    }
-                })
-                .catch(error => {
-                    console.error('Error updating resources tab:', error);
-                });
+                    resourceChart.values = [
+                        data.system_info?.cpu_percent || 0,
+                        data.system_info?.memory?.percent || 0,
+                        data.system_info?.disk?.percent || 0
+                    ];
+                    queueChartUpdate(resourceChart);
         }
-        
-        function updateDiskTab() {
-            fetch('/api/system_info_extended')
-                .then(response => response.json())
-                .then(data => {
+
+        function renderDiskTab(data) {
                     const container = document.getElementById('disk-details-container');
                     if (data.disk_partitions && data.disk_partitions.length > 0) {
                         container.innerHTML = data.disk_partitions.map(partition => `
                             <div class="disk-usage-container">
                                 <span>${partition.mountpoint}</span>
                                 <div class="disk-usage-bar">
-                                    <div class="disk-usage" style="width: ${partition.percent}%"></div>
+                                    <div class="disk-usage" style="transform: scaleX(${partition.percent / 100})"></div>
                                 </div>
                                 <span>${partition.percent}%</span>
                             </div>
@@ -1705,64 +2171,135 @@ HTML_TEMPLATE = """
                     } else {
                         container.innerHTML = '<p>No disk partitions found.</p>';
                     }
-                })
-                .catch(error => {
-                    console.error('Error updating disk tab:', error);
-                });
         }
         
-        function humanizeSize(bytes) {
-            const units = ['B', 'KB', 'MB', 'GB', 'TB'];
-            let size = bytes;
-            let unitIndex = 0;
-            while (size >= 1024 && unitIndex < units.length - 1) {
-                size /= 1024;
-                unitIndex++;
-            }
-            return size.toFixed(2) + ' ' + units[unitIndex];
-        }
     </script>
 </body>
 </html>
 """
 
+# The template's only variable is a constant, so the page is rendered
+# once at import and served as a fixed byte string; the ETag lets repeat
+# visitors revalidate with a 304 instead of re-downloading ~60 KB
+_INDEX_HTML = app.jinja_env.from_string(HTML_TEMPLATE).render(
+    refresh_interval=REFRESH_INTERVAL,
+    push_enabled='true' if socketio else 'false').encode()
+_INDEX_ETAG = hashlib.blake2b(_INDEX_HTML, digest_size=8).hexdigest()
+
+def json_response(obj):
+    """Serialize with orjson: C-level encoding straight to bytes, much
+    faster than stdlib json for the nested metric dicts we return"""
+    return app.response_class(
+        orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY),
+        mimetype='application/json'
+    )
+
+def etag_json_response(obj):
+    """json_response plus an ETag over the body: payloads that repeat
+    between polls (user info, partitions, unchanged directories) come
+    back as a bodiless 304, skipping transfer and client-side parsing"""
+    resp = json_response(obj)
+    resp.set_etag(hashlib.blake2b(resp.get_data(), digest_size=8).hexdigest())
+    return resp.make_conditional(request)
+
 # Routes
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE, refresh_interval=REFRESH_INTERVAL)
+    resp = app.response_class(_INDEX_HTML, mimetype='text/html')
+    resp.set_etag(_INDEX_ETAG)
+    # Let browsers reuse the page for a minute without even revalidating;
+    # after that the ETag turns most reloads into 304s
+    resp.cache_control.public = True
+    resp.cache_control.max_age = 60
+    return resp.make_conditional(request)
 
 @app.route('/api/system_info')
 def system_info():
-    return jsonify(get_system_info())
+    return json_response(get_system_info())
 
-@app.route('/api/system_info_extended')
-def system_info_extended():
-    """Extended system information API endpoint"""
-    return jsonify({
+@ttl_cache(0.5)
+def _extended_info():
+    """The assembled extended-info payload, shared across concurrent
+    polls so the outer dict (and its ETag body) is built once per
+    window rather than once per request"""
+    return {
         'user_info': get_user_info(),
         'load_avg': get_system_load_avg(),
         'network_interfaces': get_network_interfaces(),
         'disk_partitions': get_disk_partitions()
-    })
+    }
+
+@app.route('/api/system_info_extended')
+def system_info_extended():
+    """Extended system information API endpoint"""
+    return etag_json_response(_extended_info())
 
 @app.route('/api/files')
 def list_files():
     path = request.args.get('path', '/')
-    return jsonify(get_file_list(path))
+    offset = max(0, request.args.get('offset', 0, type=int))
+    limit = min(500, max(1, request.args.get('limit', 200, type=int)))
+    sort = request.args.get('sort', 'name')
+    return etag_json_response(get_file_list(path, offset, limit, sort))
 
 @app.route('/api/processes')
 def list_processes():
-    return jsonify(get_process_list())
+    """Stream the array row by row: on hosts with thousands of processes
+    this avoids holding the whole serialized payload (plus Flask's copy)
+    in memory while it goes out the socket"""
+    def generate():
+        yield b'['
+        first = True
+        for proc in get_process_list():
+            if not first:
+                yield b','
+            yield orjson.dumps(proc)
+            first = False
+        yield b']'
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+def _process_bundle():
+    """All processes plus both top-10 views, computed from one scan"""
+    procs = _scan_processes()
+    return {
+        'all': sorted(procs, key=lambda x: x['cpu_percent'], reverse=True),
+        'topCpu': heapq.nlargest(10, procs, key=lambda x: x['cpu_percent']),
+        'topMem': heapq.nlargest(10, procs, key=lambda x: x['memory_percent'])
+    }
+
+@app.route('/api/processes_bundle')
+def processes_bundle():
+    """One round-trip per refresh for the whole processes tab"""
+    return json_response(_process_bundle())
+
+if socketio:
+    _broadcast_started = threading.Event()
+
+    def _broadcaster():
+        """Push one consolidated frame per refresh tick; connected clients
+        then need no system-info or process polling at all"""
+        while True:
+            socketio.sleep(REFRESH_INTERVAL / 1000)
+            socketio.emit('tick', {
+                'sys': get_system_info(),
+                'procs': _process_bundle()
+            })
+
+    @socketio.on('connect')
+    def _on_connect():
+        if not _broadcast_started.is_set():
+            _broadcast_started.set()
+            socketio.start_background_task(_broadcaster)
 
 @app.route('/api/top_processes/<category>')
 def top_processes(category):
     """Get top processes by category"""
     if category == 'cpu':
-        return jsonify(get_top_processes_by_cpu())
+        return json_response(get_top_processes_by_cpu())
     elif category == 'memory':
-        return jsonify(get_top_processes_by_memory())
+        return json_response(get_top_processes_by_memory())
     else:
-        return jsonify([])
+        return json_response([])
 
 @app.route('/api/kill_process', methods=['POST'])
 def kill_process():
@@ -1771,16 +2308,16 @@ def kill_process():
         proc = psutil.Process(pid)
         proc.terminate()
         log_system_event('info', f'Terminated process {pid}')
-        return jsonify({'status': 'success'})
+        return json_response({'status': 'success'})
     except psutil.NoSuchProcess:
         log_system_event('error', f'Process {pid} not found')
-        return jsonify({'status': 'error', 'message': 'Process not found'})
+        return json_response({'status': 'error', 'message': 'Process not found'})
     except psutil.AccessDenied:
         log_system_event('error', f'Access denied when trying to kill process {pid}')
-        return jsonify({'status': 'error', 'message': 'Access denied'})
+        return json_response({'status': 'error', 'message': 'Access denied'})
     except Exception as e:
         log_system_event('error', f'Error killing process {pid}: {str(e)}')
-        return jsonify({'status': 'error', 'message': str(e)})
+        return json_response({'status': 'error', 'message': str(e)})
 
 @app.route('/api/delete', methods=['POST'])
 def delete_file():
@@ -1802,22 +2339,99 @@ def delete_file():
                 # Fallback to os.remove if send2trash is not available
                 os.remove(file_path)
             log_system_event('info', f'Moved to trash: {file_path}')
-        return jsonify({'status': 'success'})
+        return json_response({'status': 'success'})
     except Exception as e:
         log_system_event('error', f'Failed to delete {file_path}: {str(e)}')
-        return jsonify({'status': 'error', 'message': str(e)})
+        return json_response({'status': 'error', 'message': str(e)})
 
 @app.route('/api/system_log')
 def get_system_log():
-    return jsonify(SYSTEM_LOG[-50:])
+    """Last 50 entries, or only those after ?since=<seq> for pollers that
+    track their position and want deltas instead of the full tail"""
+    since = request.args.get('since', type=int)
+    # Snapshot under the log lock: iterating the deque while a logger
+    # thread appends raises "deque mutated during iteration"
+    with _log_cond:
+        if since is None:
+            # islice walks straight to the tail instead of copying the
+            # whole buffer just to slice off 50 entries
+            entries = list(islice(SYSTEM_LOG, max(0, len(SYSTEM_LOG) - 50), None))
+        else:
+            entries = [e for e in SYSTEM_LOG if e['seq'] > since]
+    return json_response(entries)
+
+def _sse_event(entry):
+    """Format one log entry as an SSE event; the id line lets EventSource
+    resume from the right seq after a reconnect"""
+    return f"id: {entry['seq']}\ndata: {orjson.dumps(entry).decode()}\n\n"
+
+@app.route('/api/system_log_stream')
+def stream_system_log():
+    """Push log entries over SSE so idle tabs stop polling an unchanged buffer"""
+    try:
+        resume = int(request.headers.get('Last-Event-ID', ''))
+    except ValueError:
+        resume = None
+
+    def generate():
+        with _log_cond:
+            if resume is not None:
+                # Reconnecting client: replay only what it missed
+                backlog = [e for e in SYSTEM_LOG if e['seq'] > resume]
+            else:
+                backlog = list(islice(SYSTEM_LOG, max(0, len(SYSTEM_LOG) - 50), None))
+            last = _log_seq
+        for entry in backlog:
+            yield _sse_event(entry)
+        while True:
+            with _log_cond:
+                _log_cond.wait(timeout=15)
+                fresh = min(_log_seq - last, len(SYSTEM_LOG))
+                entries = list(SYSTEM_LOG)[-fresh:] if fresh else []
+                last = _log_seq
+            if not entries:
+                # Comment line keeps proxies from timing out the connection
+                yield ": keep-alive\n\n"
+            for entry in entries:
+                yield _sse_event(entry)
+    return Response(generate(), mimetype='text/event-stream')
 
 @app.route('/api/performance_history')
 def get_performance_history():
-    return jsonify(get_system_performance_data())
+    return json_response(get_system_performance_data())
 
 @app.route('/api/resources')
 def get_resources():
-    return jsonify(get_system_resources())
+    return json_response(get_system_resources())
+
+@app.route('/api/batch')
+def api_batch():
+    """Serve several tab payloads in one round-trip. Each underlying
+    sampler runs at most once per request, so keys that overlap (e.g.
+    sysinfo and disks both wanting partitions) share one psutil probe"""
+    memo = {}
+
+    def once(name, fn):
+        if name not in memo:
+            memo[name] = fn()
+        return memo[name]
+
+    out = {}
+    for key in request.args.get('keys', '').split(','):
+        if key == 'sysinfo':
+            out[key] = {
+                'user_info': once('user_info', get_user_info),
+                'load_avg': once('load_avg', get_system_load_avg),
+                'network_interfaces': once('network_interfaces', get_network_interfaces),
+                'disk_partitions': once('disk_partitions', get_disk_partitions)
+            }
+        elif key == 'resources':
+            out[key] = get_system_resources(once('sample', sample_all))
+        elif key == 'perf':
+            out[key] = once('perf', get_system_performance_data)
+        elif key == 'disks':
+            out[key] = {'disk_partitions': once('disk_partitions', get_disk_partitions)}
+    return json_response(out)
 
 # Graceful shutdown handler
 def signal_handler(sig, frame):
@@ -1828,6 +2442,28 @@ def signal_handler(sig, frame):
 signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
+# Under a WSGI server __main__ never runs, so the first request starts
+# the sampler instead of relying on the dev-server entry point
+_sampler_lock = threading.Lock()
+_sampler_started = False
+
+@app.before_request
+def _ensure_sampler():
+    global _sampler_started
+    if _sampler_started:
+        return
+    with _sampler_lock:
+        if not _sampler_started:
+            _sampler_started = True
+            threading.Thread(target=_sampler, daemon=True).start()
+
 if __name__ == '__main__':
     log_system_event('info', 'Enhanced System Monitor Dashboard started')
-    app.run(debug=False, host='0.0.0.0', port=5000)
+    if socketio:
+        # This branch is explicitly the dev-server path (production runs
+        # go through gunicorn), but recent flask-socketio refuses to start
+        # Werkzeug without the opt-in flag
+        socketio.run(app, debug=False, host='0.0.0.0', port=5000,
+                     allow_unsafe_werkzeug=True)
+    else:
+        app.run(debug=False, host='0.0.0.0', port=5000)